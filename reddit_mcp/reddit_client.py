@@ -1,11 +1,26 @@
 """Reddit API client wrapper."""
 
-from typing import Any, Dict, List
+from typing import Any, AsyncIterator, Dict, List
 
+import aiohttp
 import asyncpraw
+import asyncpraw.exceptions
+import asyncprawcore
 
 from .config import RedditConfig
 
+# Errors we expect from the Reddit round-trip: API-level failures from
+# asyncpraw/asyncprawcore and transport-level failures from aiohttp.
+_REDDIT_API_ERRORS = (
+    asyncpraw.exceptions.AsyncPRAWException,
+    asyncprawcore.AsyncPrawcoreException,
+    aiohttp.ClientError,
+)
+
+
+class RedditClientError(Exception):
+    """Raised when a Reddit API call fails."""
+
 
 class RedditClient:
     """Reddit API client for MCP server."""
@@ -19,27 +34,60 @@ class RedditClient:
     def reddit(self):
         """Lazy initialize AsyncPRAW Reddit instance."""
         if self._reddit is None:
+            # One pooled HTTP session for the lifetime of the client, so
+            # every Reddit call reuses keep-alive connections instead of
+            # paying a fresh TCP+TLS handshake.
+            session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=32, ttl_dns_cache=300)
+            )
             self._reddit = asyncpraw.Reddit(
                 client_id=self.config.client_id,
                 client_secret=self.config.client_secret,
                 user_agent=self.config.user_agent,
+                requestor_kwargs={"session": session},
             )
         return self._reddit
+
+    async def close(self) -> None:
+        """Close the underlying HTTP session."""
+        if self._reddit is not None:
+            await self._reddit.close()
+            self._reddit = None
     
-    async def search_posts(
+    @staticmethod
+    def _submission_to_dict(submission, selftext_limit: int) -> Dict[str, Any]:
+        """Convert a submission into the dict shape returned by this client."""
+        selftext = submission.selftext
+        if len(selftext) > selftext_limit:
+            selftext = selftext[:selftext_limit] + "..."
+        return {
+            "id": submission.id,
+            "title": submission.title,
+            "author": str(submission.author) if submission.author else "[deleted]",
+            "score": submission.score,
+            "upvote_ratio": submission.upvote_ratio,
+            "url": submission.url,
+            "permalink": f"https://reddit.com{submission.permalink}",
+            "created_utc": submission.created_utc,
+            "num_comments": submission.num_comments,
+            "selftext": selftext,
+            "is_self": submission.is_self,
+            "domain": submission.domain,
+            "subreddit": str(submission.subreddit),
+        }
+
+    async def iter_search_posts(
         self, 
         subreddit_name: str, 
         query: str, 
         limit: int = 10,
         sort: str = "relevance",
         time_filter: str = "all"
-    ) -> List[Dict[str, Any]]:
-        """Search for posts in a subreddit."""
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Yield search results from a subreddit one post at a time."""
         try:
             subreddit = await self.reddit.subreddit(subreddit_name)
             
-            # Search posts
-            posts = []
             search_results = subreddit.search(
                 query, 
                 limit=limit, 
@@ -48,27 +96,26 @@ class RedditClient:
             )
             
             async for submission in search_results:
-                post_data = {
-                    "id": submission.id,
-                    "title": submission.title,
-                    "author": str(submission.author) if submission.author else "[deleted]",
-                    "score": submission.score,
-                    "upvote_ratio": submission.upvote_ratio,
-                    "url": submission.url,
-                    "permalink": f"https://reddit.com{submission.permalink}",
-                    "created_utc": submission.created_utc,
-                    "num_comments": submission.num_comments,
-                    "selftext": submission.selftext[:500] + "..." if len(submission.selftext) > 500 else submission.selftext,
-                    "is_self": submission.is_self,
-                    "domain": submission.domain,
-                    "subreddit": str(submission.subreddit),
-                }
-                posts.append(post_data)
+                yield self._submission_to_dict(submission, selftext_limit=500)
             
-            return posts
-            
-        except Exception as e:
-            raise Exception(f"Error searching posts in r/{subreddit_name}: {str(e)}")
+        except _REDDIT_API_ERRORS as e:
+            raise RedditClientError(f"Error searching posts in r/{subreddit_name}: {str(e)}") from e
+    
+    async def search_posts(
+        self, 
+        subreddit_name: str, 
+        query: str, 
+        limit: int = 10,
+        sort: str = "relevance",
+        time_filter: str = "all"
+    ) -> List[Dict[str, Any]]:
+        """Search for posts in a subreddit."""
+        return [
+            post
+            async for post in self.iter_search_posts(
+                subreddit_name, query, limit=limit, sort=sort, time_filter=time_filter
+            )
+        ]
     
     async def get_post_details(self, post_id: str) -> Dict[str, Any]:
         """Get detailed information about a specific post."""
@@ -94,8 +141,8 @@ class RedditClient:
                 "stickied": submission.stickied,
             }
             
-        except Exception as e:
-            raise Exception(f"Error getting post details for {post_id}: {str(e)}")
+        except _REDDIT_API_ERRORS as e:
+            raise RedditClientError(f"Error getting post details for {post_id}: {str(e)}") from e
     
 
     
@@ -118,51 +165,38 @@ class RedditClient:
                 "url": f"https://reddit.com/r/{subreddit.display_name}",
             }
             
-        except Exception as e:
-            raise Exception(f"Error getting subreddit info for r/{subreddit_name}: {str(e)}")
+        except _REDDIT_API_ERRORS as e:
+            raise RedditClientError(f"Error getting subreddit info for r/{subreddit_name}: {str(e)}") from e
     
-    async def get_hot_posts(self, subreddit_name: str, limit: int = 10) -> List[Dict[str, Any]]:
-        """Get hot posts from a subreddit."""
+    async def iter_hot_posts(
+        self, subreddit_name: str, limit: int = 10
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Yield hot posts from a subreddit one post at a time."""
         try:
             subreddit = await self.reddit.subreddit(subreddit_name)
             
-            posts = []
             async for submission in subreddit.hot(limit=limit):
-                post_data = {
-                    "id": submission.id,
-                    "title": submission.title,
-                    "author": str(submission.author) if submission.author else "[deleted]",
-                    "score": submission.score,
-                    "upvote_ratio": submission.upvote_ratio,
-                    "url": submission.url,
-                    "permalink": f"https://reddit.com{submission.permalink}",
-                    "created_utc": submission.created_utc,
-                    "num_comments": submission.num_comments,
-                    "selftext": submission.selftext[:200] + "..." if len(submission.selftext) > 200 else submission.selftext,
-                    "is_self": submission.is_self,
-                    "domain": submission.domain,
-                    "subreddit": str(submission.subreddit),
-                }
-                posts.append(post_data)
-            
-            return posts
+                yield self._submission_to_dict(submission, selftext_limit=200)
             
-        except Exception as e:
-            raise Exception(f"Error getting hot posts from r/{subreddit_name}: {str(e)}")
+        except _REDDIT_API_ERRORS as e:
+            raise RedditClientError(f"Error getting hot posts from r/{subreddit_name}: {str(e)}") from e
     
-    async def search_all_reddit(
+    async def get_hot_posts(self, subreddit_name: str, limit: int = 10) -> List[Dict[str, Any]]:
+        """Get hot posts from a subreddit."""
+        return [post async for post in self.iter_hot_posts(subreddit_name, limit=limit)]
+    
+    async def iter_search_all_reddit(
         self, 
         query: str, 
         limit: int = 10,
         sort: str = "relevance",
         time_filter: str = "all"
-    ) -> List[Dict[str, Any]]:
-        """Search for posts across all of Reddit (site-wide search)."""
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Yield site-wide search results one post at a time."""
         try:
             # Search all of reddit using the 'all' subreddit
             all_subreddit = await self.reddit.subreddit("all")
             
-            posts = []
             search_results = all_subreddit.search(
                 query, 
                 limit=limit, 
@@ -171,24 +205,22 @@ class RedditClient:
             )
             
             async for submission in search_results:
-                post_data = {
-                    "id": submission.id,
-                    "title": submission.title,
-                    "author": str(submission.author) if submission.author else "[deleted]",
-                    "score": submission.score,
-                    "upvote_ratio": submission.upvote_ratio,
-                    "url": submission.url,
-                    "permalink": f"https://reddit.com{submission.permalink}",
-                    "created_utc": submission.created_utc,
-                    "num_comments": submission.num_comments,
-                    "selftext": submission.selftext[:500] + "..." if len(submission.selftext) > 500 else submission.selftext,
-                    "is_self": submission.is_self,
-                    "domain": submission.domain,
-                    "subreddit": str(submission.subreddit),
-                }
-                posts.append(post_data)
-            
-            return posts
+                yield self._submission_to_dict(submission, selftext_limit=500)
             
-        except Exception as e:
-            raise Exception(f"Error searching all Reddit for query '{query}': {str(e)}")
\ No newline at end of file
+        except _REDDIT_API_ERRORS as e:
+            raise RedditClientError(f"Error searching all Reddit for query '{query}': {str(e)}") from e
+    
+    async def search_all_reddit(
+        self, 
+        query: str, 
+        limit: int = 10,
+        sort: str = "relevance",
+        time_filter: str = "all"
+    ) -> List[Dict[str, Any]]:
+        """Search for posts across all of Reddit (site-wide search)."""
+        return [
+            post
+            async for post in self.iter_search_all_reddit(
+                query, limit=limit, sort=sort, time_filter=time_filter
+            )
+        ]
\ No newline at end of file
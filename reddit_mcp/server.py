@@ -1,12 +1,20 @@
 """Reddit MCP Server implementation using FastMCP."""
 
+import asyncio
 import logging
+import time
 from typing import  Optional
 
 from fastmcp import FastMCP
 
+# Optional extra: uvloop provides a faster, libuv-backed event loop
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
 from .config import RedditConfig
-from .reddit_client import RedditClient
+from .reddit_client import RedditClient, RedditClientError
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
@@ -18,6 +26,64 @@ mcp = FastMCP("reddit-mcp-tool")
 # Global client instance
 reddit_client: Optional[RedditClient] = None
 
+# Built once at import time so each tool call returns the same string object
+# instead of re-creating it per invocation.
+CLIENT_NOT_INITIALIZED_ERROR = """Error: Reddit client not initialized.
+
+To fix this:
+1. Copy env.example to .env: cp env.example .env
+2. Edit .env with your Reddit API credentials:
+   - Get credentials from https://old.reddit.com/prefs/apps/
+   - Create a 'script' type app
+   - Fill in REDDIT_CLIENT_ID, REDDIT_CLIENT_SECRET, and REDDIT_USER_AGENT
+3. Restart the MCP server
+
+Example .env content:
+REDDIT_CLIENT_ID=your_14_char_client_id
+REDDIT_CLIENT_SECRET=your_27_char_client_secret
+REDDIT_USER_AGENT=reddit-mcp-tool:v0.2.0 (by /u/yourusername)"""
+
+# Hard cap on posts returned per call, mirrored in each tool's docstring.
+MAX_POSTS_LIMIT = 100
+
+# Allowed values for the search parameters, checked up front so malformed
+# requests are rejected before any Reddit round-trip.
+VALID_SORTS = frozenset({"relevance", "hot", "top", "new", "comments"})
+VALID_TIME_FILTERS = frozenset({"all", "day", "week", "month", "year"})
+
+# TTL caches for informational (read-only) tools, keyed by tool arguments.
+# Repeated calls with identical arguments are served from memory instead of
+# hitting Reddit again. Any future tool with command semantics (voting,
+# posting, etc.) must not be cached here.
+_CACHE_TTLS = {
+    "search_reddit_posts": 30.0,
+    "search_reddit_all": 30.0,
+    "get_subreddit_info": 60.0,
+    "get_hot_reddit_posts": 30.0,
+}
+_CACHE_MAX_ENTRIES = 512
+_caches: dict = {tool: {} for tool in _CACHE_TTLS}
+
+
+def _cache_get(tool: str, key: tuple) -> Optional[str]:
+    """Return the cached result for a tool call, or None if absent/expired."""
+    entry = _caches[tool].get(key)
+    if entry is None:
+        return None
+    expires_at, value = entry
+    if time.monotonic() >= expires_at:
+        del _caches[tool][key]
+        return None
+    return value
+
+
+def _cache_set(tool: str, key: tuple, value: str) -> None:
+    """Cache a successful tool result under the tool's TTL."""
+    cache = _caches[tool]
+    if len(cache) >= _CACHE_MAX_ENTRIES:
+        cache.clear()
+    cache[key] = (time.monotonic() + _CACHE_TTLS[tool], value)
+
 
 def initialize_reddit_client():
     """Initialize the Reddit client with configuration."""
@@ -27,7 +93,7 @@ def initialize_reddit_client():
         reddit_client = RedditClient(config)
         logger.info("Reddit client initialized successfully in read-only mode")
     except Exception as e:
-        logger.error(f"Failed to initialize Reddit client: {str(e)}")
+        logger.error("Failed to initialize Reddit client: %s", e)
         logger.error("Please ensure you have created a .env file with your Reddit API credentials.")
         logger.error("Copy env.example to .env and fill in your Reddit API details.")
         reddit_client = None
@@ -55,37 +121,32 @@ async def search_reddit_posts(
         Human readable string containing search results
     """
     if reddit_client is None:
-        return """Error: Reddit client not initialized. 
+        return CLIENT_NOT_INITIALIZED_ERROR
+    
+    if sort not in VALID_SORTS:
+        return f"Error: invalid sort '{sort}'. Valid options: {', '.join(sorted(VALID_SORTS))}"
+    if time_filter not in VALID_TIME_FILTERS:
+        return f"Error: invalid time_filter '{time_filter}'. Valid options: {', '.join(sorted(VALID_TIME_FILTERS))}"
 
-To fix this:
-1. Copy env.example to .env: cp env.example .env
-2. Edit .env with your Reddit API credentials:
-   - Get credentials from https://old.reddit.com/prefs/apps/
-   - Create a 'script' type app
-   - Fill in REDDIT_CLIENT_ID, REDDIT_CLIENT_SECRET, and REDDIT_USER_AGENT
-3. Restart the MCP server
+    cache_key = (subreddit, query, limit, sort, time_filter)
+    cached = _cache_get("search_reddit_posts", cache_key)
+    if cached is not None:
+        return cached
 
-Example .env content:
-REDDIT_CLIENT_ID=your_14_char_client_id
-REDDIT_CLIENT_SECRET=your_27_char_client_secret  
-REDDIT_USER_AGENT=reddit-mcp-tool:v0.2.0 (by /u/yourusername)"""
-    
     try:
-        posts = await reddit_client.search_posts(
+        # Stream posts from the client and format each one as it arrives, so
+        # the full post list is never materialized alongside the output text.
+        i = 0
+        parts = []
+        async for post in reddit_client.iter_search_posts(
             subreddit_name=subreddit,
             query=query,
-            limit=min(limit, 100),
+            limit=min(limit, MAX_POSTS_LIMIT),
             sort=sort,
             time_filter=time_filter
-        )
-        
-        if not posts:
-            return f"No posts found in r/{subreddit} for query: '{query}'"
-        
-        result = f"Found {len(posts)} posts in r/{subreddit} for query: '{query}'\n\n"
-        
-        for i, post in enumerate(posts, 1):
-            result += (
+        ):
+            i += 1
+            parts.append(
                 f"{i}. **{post['title']}**\n"
                 f"   Author: {post['author']}\n"
                 f"   Score: {post['score']} (upvote ratio: {post['upvote_ratio']:.0%})\n"
@@ -93,17 +154,23 @@ REDDIT_USER_AGENT=reddit-mcp-tool:v0.2.0 (by /u/yourusername)"""
                 f"   Link: {post['permalink']}\n"
                 f"   Subreddit: r/{post['subreddit']}\n"
             )
-            
+
             if post['selftext'] and len(post['selftext']) > 0:
                 preview = post['selftext'][:200] + "..." if len(post['selftext']) > 200 else post['selftext']
-                result += f"   Content: {preview}\n"
-            
-            result += "\n"
-        
+                parts.append(f"   Content: {preview}\n")
+
+            parts.append("\n")
+
+        if i == 0:
+            return f"No posts found in r/{subreddit} for query: '{query}'"
+
+        parts.insert(0, f"Found {i} posts in r/{subreddit} for query: '{query}'\n\n")
+        result = "".join(parts)
+        _cache_set("search_reddit_posts", cache_key, result)
         return result
-        
-    except Exception as e:
-        logger.error(f"Error searching posts in r/{subreddit}: {str(e)}")
+
+    except RedditClientError as e:
+        logger.error("Error searching posts in r/%s: %s", subreddit, e)
         return f"Error searching posts in r/{subreddit}: {str(e)}"
 
 
@@ -127,36 +194,31 @@ async def search_reddit_all(
         Human readable string containing search results from across Reddit
     """
     if reddit_client is None:
-        return """Error: Reddit client not initialized. 
+        return CLIENT_NOT_INITIALIZED_ERROR
+    
+    if sort not in VALID_SORTS:
+        return f"Error: invalid sort '{sort}'. Valid options: {', '.join(sorted(VALID_SORTS))}"
+    if time_filter not in VALID_TIME_FILTERS:
+        return f"Error: invalid time_filter '{time_filter}'. Valid options: {', '.join(sorted(VALID_TIME_FILTERS))}"
 
-To fix this:
-1. Copy env.example to .env: cp env.example .env
-2. Edit .env with your Reddit API credentials:
-   - Get credentials from https://old.reddit.com/prefs/apps/
-   - Create a 'script' type app
-   - Fill in REDDIT_CLIENT_ID, REDDIT_CLIENT_SECRET, and REDDIT_USER_AGENT
-3. Restart the MCP server
+    cache_key = (query, limit, sort, time_filter)
+    cached = _cache_get("search_reddit_all", cache_key)
+    if cached is not None:
+        return cached
 
-Example .env content:
-REDDIT_CLIENT_ID=your_14_char_client_id
-REDDIT_CLIENT_SECRET=your_27_char_client_secret  
-REDDIT_USER_AGENT=reddit-mcp-tool:v0.2.0 (by /u/yourusername)"""
-    
     try:
-        posts = await reddit_client.search_all_reddit(
+        # Stream posts from the client and format each one as it arrives, so
+        # the full post list is never materialized alongside the output text.
+        i = 0
+        parts = []
+        async for post in reddit_client.iter_search_all_reddit(
             query=query,
-            limit=min(limit, 100),
+            limit=min(limit, MAX_POSTS_LIMIT),
             sort=sort,
             time_filter=time_filter
-        )
-        
-        if not posts:
-            return f"No posts found across Reddit for query: '{query}'"
-        
-        result = f"Found {len(posts)} posts across all Reddit for query: '{query}'\n\n"
-        
-        for i, post in enumerate(posts, 1):
-            result += (
+        ):
+            i += 1
+            parts.append(
                 f"{i}. **{post['title']}**\n"
                 f"   Author: {post['author']}\n"
                 f"   Score: {post['score']} (upvote ratio: {post['upvote_ratio']:.0%})\n"
@@ -164,17 +226,23 @@ REDDIT_USER_AGENT=reddit-mcp-tool:v0.2.0 (by /u/yourusername)"""
                 f"   Link: {post['permalink']}\n"
                 f"   Subreddit: r/{post['subreddit']}\n"
             )
-            
+
             if post['selftext'] and len(post['selftext']) > 0:
                 preview = post['selftext'][:200] + "..." if len(post['selftext']) > 200 else post['selftext']
-                result += f"   Content: {preview}\n"
-            
-            result += "\n"
-        
+                parts.append(f"   Content: {preview}\n")
+
+            parts.append("\n")
+
+        if i == 0:
+            return f"No posts found across Reddit for query: '{query}'"
+
+        parts.insert(0, f"Found {i} posts across all Reddit for query: '{query}'\n\n")
+        result = "".join(parts)
+        _cache_set("search_reddit_all", cache_key, result)
         return result
-        
-    except Exception as e:
-        logger.error(f"Error searching all Reddit for query '{query}': {str(e)}")
+
+    except RedditClientError as e:
+        logger.error("Error searching all Reddit for query '%s': %s", query, e)
         return f"Error searching all Reddit for query '{query}': {str(e)}"
 
 
@@ -190,20 +258,7 @@ async def get_reddit_post_details(post_id: str) -> str:
         Human readable string containing detailed post information
     """
     if reddit_client is None:
-        return """Error: Reddit client not initialized. 
-
-To fix this:
-1. Copy env.example to .env: cp env.example .env
-2. Edit .env with your Reddit API credentials:
-   - Get credentials from https://old.reddit.com/prefs/apps/
-   - Create a 'script' type app
-   - Fill in REDDIT_CLIENT_ID, REDDIT_CLIENT_SECRET, and REDDIT_USER_AGENT
-3. Restart the MCP server
-
-Example .env content:
-REDDIT_CLIENT_ID=your_14_char_client_id
-REDDIT_CLIENT_SECRET=your_27_char_client_secret  
-REDDIT_USER_AGENT=reddit-mcp-tool:v0.2.0 (by /u/yourusername)"""
+        return CLIENT_NOT_INITIALIZED_ERROR
     
     try:
         post_details = await reddit_client.get_post_details(post_id)
@@ -228,8 +283,8 @@ REDDIT_USER_AGENT=reddit-mcp-tool:v0.2.0 (by /u/yourusername)"""
         
         return result
         
-    except Exception as e:
-        logger.error(f"Error getting post details for {post_id}: {str(e)}")
+    except RedditClientError as e:
+        logger.error("Error getting post details for %s: %s", post_id, e)
         return f"Error getting post details for {post_id}: {str(e)}"
 
 
@@ -245,21 +300,13 @@ async def get_subreddit_info(subreddit: str) -> str:
         Human readable string containing subreddit information
     """
     if reddit_client is None:
-        return """Error: Reddit client not initialized. 
-
-To fix this:
-1. Copy env.example to .env: cp env.example .env
-2. Edit .env with your Reddit API credentials:
-   - Get credentials from https://old.reddit.com/prefs/apps/
-   - Create a 'script' type app
-   - Fill in REDDIT_CLIENT_ID, REDDIT_CLIENT_SECRET, and REDDIT_USER_AGENT
-3. Restart the MCP server
-
-Example .env content:
-REDDIT_CLIENT_ID=your_14_char_client_id
-REDDIT_CLIENT_SECRET=your_27_char_client_secret  
-REDDIT_USER_AGENT=reddit-mcp-tool:v0.2.0 (by /u/yourusername)"""
+        return CLIENT_NOT_INITIALIZED_ERROR
     
+    cache_key = (subreddit,)
+    cached = _cache_get("get_subreddit_info", cache_key)
+    if cached is not None:
+        return cached
+
     try:
         subreddit_info = await reddit_client.get_subreddit_info(subreddit)
         
@@ -275,11 +322,12 @@ REDDIT_USER_AGENT=reddit-mcp-tool:v0.2.0 (by /u/yourusername)"""
         
         if subreddit_info['description'] and subreddit_info['description'] != subreddit_info['public_description']:
             result += f"\nFull Description:\n{subreddit_info['description']}\n"
-        
+
+        _cache_set("get_subreddit_info", cache_key, result)
         return result
         
-    except Exception as e:
-        logger.error(f"Error getting subreddit info for r/{subreddit}: {str(e)}")
+    except RedditClientError as e:
+        logger.error("Error getting subreddit info for r/%s: %s", subreddit, e)
         return f"Error getting subreddit info for r/{subreddit}: {str(e)}"
 
 
@@ -296,58 +344,64 @@ async def get_hot_reddit_posts(subreddit: str, limit: int = 10) -> str:
         Human readable string containing hot posts
     """
     if reddit_client is None:
-        return """Error: Reddit client not initialized. 
-
-To fix this:
-1. Copy env.example to .env: cp env.example .env
-2. Edit .env with your Reddit API credentials:
-   - Get credentials from https://old.reddit.com/prefs/apps/
-   - Create a 'script' type app
-   - Fill in REDDIT_CLIENT_ID, REDDIT_CLIENT_SECRET, and REDDIT_USER_AGENT
-3. Restart the MCP server
-
-Example .env content:
-REDDIT_CLIENT_ID=your_14_char_client_id
-REDDIT_CLIENT_SECRET=your_27_char_client_secret  
-REDDIT_USER_AGENT=reddit-mcp-tool:v0.2.0 (by /u/yourusername)"""
+        return CLIENT_NOT_INITIALIZED_ERROR
     
+    cache_key = (subreddit, limit)
+    cached = _cache_get("get_hot_reddit_posts", cache_key)
+    if cached is not None:
+        return cached
+
     try:
-        posts = await reddit_client.get_hot_posts(subreddit, min(limit, 100))
-        
-        if not posts:
-            return f"No hot posts found in r/{subreddit}"
-        
-        result = f"Hot posts from r/{subreddit}:\n\n"
-        
-        for i, post in enumerate(posts, 1):
-            result += (
+        # Stream posts from the client and format each one as it arrives, so
+        # the full post list is never materialized alongside the output text.
+        i = 0
+        parts = [f"Hot posts from r/{subreddit}:\n\n"]
+        async for post in reddit_client.iter_hot_posts(
+            subreddit, min(limit, MAX_POSTS_LIMIT)
+        ):
+            i += 1
+            parts.append(
                 f"{i}. **{post['title']}**\n"
                 f"   Author: {post['author']}\n"
                 f"   Score: {post['score']} (upvote ratio: {post['upvote_ratio']:.0%})\n"
                 f"   Comments: {post['num_comments']}\n"
                 f"   Link: {post['permalink']}\n"
             )
-            
+
             if post['selftext'] and len(post['selftext']) > 0:
                 preview = post['selftext'][:150] + "..." if len(post['selftext']) > 150 else post['selftext']
-                result += f"   Content: {preview}\n"
-            
-            result += "\n"
-        
+                parts.append(f"   Content: {preview}\n")
+
+            parts.append("\n")
+
+        if i == 0:
+            return f"No hot posts found in r/{subreddit}"
+
+        result = "".join(parts)
+        _cache_set("get_hot_reddit_posts", cache_key, result)
         return result
-        
-    except Exception as e:
-        logger.error(f"Error getting hot posts from r/{subreddit}: {str(e)}")
+
+    except RedditClientError as e:
+        logger.error("Error getting hot posts from r/%s: %s", subreddit, e)
         return f"Error getting hot posts from r/{subreddit}: {str(e)}"
 
 
 def run_server():
     """Entry point for the CLI command."""
+    # Use uvloop for the event loop when available (optional extra)
+    if uvloop is not None:
+        uvloop.install()
+
     # Initialize Reddit client
     initialize_reddit_client()
-    
+
     # Run the FastMCP server
-    mcp.run()
+    try:
+        mcp.run()
+    finally:
+        # Close the pooled HTTP session cleanly on shutdown
+        if reddit_client is not None:
+            asyncio.run(reddit_client.close())
 
 
 if __name__ == "__main__":
@@ -0,0 +1,90 @@
+"""Tests for reddit_mcp.server module."""
+
+import asyncio
+
+import pytest
+
+fastmcp = pytest.importorskip("fastmcp")
+
+from reddit_mcp import server
+
+
+@pytest.fixture(autouse=True)
+def clear_caches():
+    """Ensure each test starts with empty tool caches."""
+    for cache in server._caches.values():
+        cache.clear()
+    yield
+    for cache in server._caches.values():
+        cache.clear()
+
+
+def test_cache_miss_returns_none():
+    """Unknown keys are cache misses."""
+    assert server._cache_get("get_subreddit_info", ("python",)) is None
+
+
+def test_cache_set_then_get():
+    """Stored results are returned before the TTL expires."""
+    server._cache_set("get_subreddit_info", ("python",), "cached result")
+    assert server._cache_get("get_subreddit_info", ("python",)) == "cached result"
+
+
+def test_cache_expiry(monkeypatch):
+    """Entries expire once the tool's TTL has elapsed."""
+    now = 1000.0
+    monkeypatch.setattr(server.time, "monotonic", lambda: now)
+    server._cache_set("get_hot_reddit_posts", ("python", 10), "hot posts")
+
+    now += server._CACHE_TTLS["get_hot_reddit_posts"] + 1
+    assert server._cache_get("get_hot_reddit_posts", ("python", 10)) is None
+
+
+def test_search_rejects_invalid_sort(monkeypatch):
+    """Invalid sort values are rejected before any Reddit call."""
+    monkeypatch.setattr(server, "reddit_client", object())
+    result = asyncio.run(
+        server.search_reddit_posts("python", "mcp", sort="bogus")
+    )
+    assert "invalid sort 'bogus'" in result
+
+
+def test_search_all_rejects_invalid_time_filter(monkeypatch):
+    """Invalid time_filter values are rejected before any Reddit call."""
+    monkeypatch.setattr(server, "reddit_client", object())
+    result = asyncio.run(
+        server.search_reddit_all("mcp", time_filter="decade")
+    )
+    assert "invalid time_filter 'decade'" in result
+
+
+def test_search_formats_streamed_posts(monkeypatch):
+    """Posts streamed from the client are numbered and formatted in order."""
+
+    class FakeClient:
+        async def iter_search_posts(self, **kwargs):
+            for title in ("First post", "Second post"):
+                yield {
+                    "title": title,
+                    "author": "someone",
+                    "score": 42,
+                    "upvote_ratio": 0.9,
+                    "num_comments": 7,
+                    "permalink": "https://reddit.com/r/python/1",
+                    "subreddit": "python",
+                    "selftext": "",
+                }
+
+    monkeypatch.setattr(server, "reddit_client", FakeClient())
+    result = asyncio.run(server.search_reddit_posts("python", "mcp"))
+    assert result.startswith("Found 2 posts in r/python for query: 'mcp'")
+    assert "1. **First post**" in result
+    assert "2. **Second post**" in result
+
+
+def test_cache_eviction_on_max_entries():
+    """The cache is cleared rather than grown without bound."""
+    for i in range(server._CACHE_MAX_ENTRIES):
+        server._cache_set("search_reddit_posts", ("python", str(i)), "result")
+    server._cache_set("search_reddit_posts", ("python", "overflow"), "result")
+    assert len(server._caches["search_reddit_posts"]) == 1